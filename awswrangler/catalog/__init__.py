@@ -1,6 +1,12 @@
 """Amazon Glue Catalog Module."""
 
-from awswrangler.catalog._add import add_column, add_csv_partitions, add_parquet_partitions  # noqa
+from awswrangler.catalog._add import (  # noqa
+    add_column,
+    add_columns,
+    add_csv_partitions,
+    add_parquet_partitions,
+    add_partitions,
+)
 from awswrangler.catalog._create import (  # noqa
     _create_csv_table,
     _create_parquet_table,
@@ -48,8 +54,10 @@ from awswrangler.catalog._utils import (  # noqa
 
 __all__ = [
     "add_column",
+    "add_columns",
     "add_csv_partitions",
     "add_parquet_partitions",
+    "add_partitions",
     "does_table_exist",
     "delete_column",
     "drop_duplicated_columns",
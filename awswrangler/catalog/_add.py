@@ -1,42 +1,204 @@
 """AWS Glue Catalog Delete Module."""
 
+import concurrent.futures
+import importlib.util
+import itertools
+import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import os
+import weakref
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import boto3
+import botocore.config
+import botocore.serialize
 
 from awswrangler import _utils, exceptions
 from awswrangler._config import apply_configs
 from awswrangler.catalog._definitions import (
     _check_column_type,
-    _csv_partition_definition,
-    _parquet_partition_definition,
+    _csv_partition_template,
+    _fill_partition_template,
+    _parquet_partition_template,
     _update_table_definition,
 )
 from awswrangler.catalog._utils import _catalog_id, sanitize_table_name
 
+_orjson_found = importlib.util.find_spec("orjson")
+if _orjson_found:
+    import orjson  # pylint: disable=import-error
+
 _logger: logging.Logger = logging.getLogger(__name__)
 
+_MAX_POOL_CONNECTIONS: int = 32
+_MAX_WORKERS: int = _MAX_POOL_CONNECTIONS  # IO-bound calls: one pooled HTTPS connection per worker
+_BATCH_CREATE_PARTITION_MAX: int = 100  # Hard limit of the Glue BatchCreatePartition API
+_BATCH_CREATE_PARTITION_MIN: int = 10
+_TARGET_CHUNK_BYTES: int = 1_000_000  # Keep request payloads around 1MB to avoid server-side tail latency
+
+
+def _estimate_chunk_length(partition_input: Dict[str, Any]) -> int:
+    """Pick a chunk length targeting ~1MB serialized per request (sampled from one PartitionInput)."""
+    if _orjson_found:
+        item_bytes: int = len(orjson.dumps(partition_input))
+    else:
+        item_bytes = len(json.dumps(partition_input, separators=(",", ":")))
+    chunk_length: int = max(
+        _BATCH_CREATE_PARTITION_MIN, min(_BATCH_CREATE_PARTITION_MAX, _TARGET_CHUNK_BYTES // max(item_bytes, 1))
+    )
+    _logger.debug("item_bytes: %s / chunk_length: %s", item_bytes, chunk_length)
+    return chunk_length
+
+
+def _chunk_iter(iterable: Iterable[Any], max_length: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    while True:
+        chunk: List[Any] = list(itertools.islice(iterator, max_length))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _dedup_inputs(inputs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Drop PartitionInputs repeating the same (Location, Values) pair, saving wasted Glue round-trips."""
+    seen: Set[Tuple[str, Tuple[str, ...]]] = set()
+    for partition_input in inputs:
+        fingerprint = (partition_input["StorageDescriptor"]["Location"], tuple(partition_input["Values"]))
+        if fingerprint not in seen:
+            seen.add(fingerprint)
+            yield partition_input
+
+
+def _glue_botocore_config() -> botocore.config.Config:
+    """Botocore configuration for the Glue clients used by this module (connection reuse under concurrency)."""
+    retries_config: Dict[str, Union[str, int]] = {
+        "max_attempts": int(os.getenv("AWS_MAX_ATTEMPTS", "10")),
+        "mode": os.getenv("AWS_RETRY_MODE", "adaptive"),
+    }
+    kwargs: Dict[str, Any] = {
+        "retries": retries_config,
+        "connect_timeout": 10,
+        "max_pool_connections": _MAX_POOL_CONNECTIONS,
+    }
+    if "tcp_keepalive" in botocore.config.Config.OPTION_DEFAULTS:  # botocore >= 1.27.84
+        kwargs["tcp_keepalive"] = True
+    return botocore.config.Config(**kwargs)
+
+
+class _OrjsonSerializer(botocore.serialize.JSONSerializer):  # type: ignore[misc]
+    """JSONSerializer variant encoding request bodies with orjson (3-5x faster for big partition batches)."""
+
+    def serialize_to_request(self, parameters: Dict[str, Any], operation_model: Any) -> Dict[str, Any]:
+        """Serialize the request parameters, delegating the body encoding to orjson."""
+        target: str = f"{operation_model.metadata['targetPrefix']}.{operation_model.name}"
+        json_version: str = operation_model.metadata["jsonVersion"]
+        serialized: Dict[str, Any] = self._create_default_request()
+        serialized["method"] = operation_model.http.get("method", self.DEFAULT_METHOD)
+        serialized["headers"] = {
+            "X-Amz-Target": target,
+            "Content-Type": f"application/x-amz-json-{json_version}",
+        }
+        body: Dict[str, Any] = {}
+        if operation_model.input_shape is not None:
+            self._serialize(body, parameters, operation_model.input_shape)
+        serialized["body"] = orjson.dumps(body)
+        host_prefix = self._expand_host_prefix(parameters, operation_model)
+        if host_prefix is not None:
+            serialized["host_prefix"] = host_prefix
+        return serialized
+
+
+def _enable_orjson_serialization(client_glue: boto3.client) -> None:
+    """Swap the client's stdlib json serializer for an orjson-backed one (best effort)."""
+    try:
+        validator = client_glue._serializer  # pylint: disable=protected-access
+        serializer = getattr(validator, "_serializer", validator)
+        if type(serializer) is botocore.serialize.JSONSerializer:  # pylint: disable=unidiomatic-typecheck
+            if hasattr(validator, "_serializer"):
+                validator._serializer = _OrjsonSerializer()  # pylint: disable=protected-access
+            else:
+                client_glue._serializer = _OrjsonSerializer()  # pylint: disable=protected-access
+    except Exception as ex:  # pylint: disable=broad-except
+        _logger.debug("Could not enable orjson serialization: %s", ex)
+
+
+_glue_client_cache: "weakref.WeakKeyDictionary[boto3.Session, boto3.client]" = weakref.WeakKeyDictionary()
+_glue_client_default: Optional[boto3.client] = None
+
+
+def _build_glue_client(session: Optional[boto3.Session]) -> boto3.client:
+    client_glue: boto3.client = _utils.client(
+        service_name="glue", session=session, botocore_config=_glue_botocore_config()
+    )
+    if _orjson_found:
+        _enable_orjson_serialization(client_glue=client_glue)
+    return client_glue
+
+
+def _glue_client(boto3_session: Optional[boto3.Session] = None) -> boto3.client:
+    """Return a cached Glue client for the session (client construction costs tens of ms per call)."""
+    global _glue_client_default  # pylint: disable=global-statement
+    if boto3_session is None and boto3.DEFAULT_SESSION is None:
+        # ensure_session would mint a throwaway boto3.Session here, so the
+        # weak-keyed cache below could never hit; keep one client in a
+        # module-level slot for this (most common) call pattern instead.
+        if _glue_client_default is None:
+            _glue_client_default = _build_glue_client(session=None)
+        return _glue_client_default
+    session: boto3.Session = _utils.ensure_session(session=boto3_session)
+    client_glue: Optional[boto3.client] = _glue_client_cache.get(session)
+    if client_glue is None:
+        client_glue = _build_glue_client(session=session)
+        _glue_client_cache[session] = client_glue
+    return client_glue
+
+
+def _create_partitions_chunk(
+    client_glue: boto3.client,
+    batch_kwargs: Dict[str, Any],
+    chunk: List[Dict[str, Any]],
+) -> None:
+    res: Dict[str, Any] = client_glue.batch_create_partition(**batch_kwargs, PartitionInputList=chunk)
+    errors: Optional[List[Dict[str, Any]]] = res.get("Errors")
+    if errors and any(
+        error.get("ErrorDetail", {}).get("ErrorCode", "AlreadyExistsException") != "AlreadyExistsException"
+        for error in errors
+    ):
+        raise exceptions.ServiceApiError(str(errors))
+
 
 def _add_partitions(
     database: str,
     table: str,
     boto3_session: Optional[boto3.Session],
-    inputs: List[Dict[str, Any]],
+    inputs: Iterable[Dict[str, Any]],
     catalog_id: Optional[str] = None,
 ) -> None:
-    chunks: List[List[Dict[str, Any]]] = _utils.chunkify(lst=inputs, max_length=100)
-    client_glue: boto3.client = _utils.client(service_name="glue", session=boto3_session)
-    for chunk in chunks:  # pylint: disable=too-many-nested-blocks
-        res: Dict[str, Any] = client_glue.batch_create_partition(
-            **_catalog_id(catalog_id=catalog_id, DatabaseName=database, TableName=table, PartitionInputList=chunk)
-        )
-        if ("Errors" in res) and res["Errors"]:
-            for error in res["Errors"]:
-                if "ErrorDetail" in error:
-                    if "ErrorCode" in error["ErrorDetail"]:
-                        if error["ErrorDetail"]["ErrorCode"] != "AlreadyExistsException":
-                            raise exceptions.ServiceApiError(str(res["Errors"]))
+    inputs_iter: Iterator[Dict[str, Any]] = _dedup_inputs(inputs=inputs)
+    first: Optional[Dict[str, Any]] = next(inputs_iter, None)
+    if first is None:
+        return
+    client_glue: boto3.client = _glue_client(boto3_session=boto3_session)
+    batch_kwargs: Dict[str, Any] = _catalog_id(catalog_id=catalog_id, DatabaseName=database, TableName=table)
+    chunk_length: int = _estimate_chunk_length(partition_input=first)
+    chunks: Iterator[List[Dict[str, Any]]] = _chunk_iter(
+        iterable=itertools.chain([first], inputs_iter), max_length=chunk_length
+    )
+    first_chunk: List[Dict[str, Any]] = next(chunks)
+    second_chunk: Optional[List[Dict[str, Any]]] = next(chunks, None)
+    if second_chunk is None:
+        _create_partitions_chunk(client_glue=client_glue, batch_kwargs=batch_kwargs, chunk=first_chunk)
+        return
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        futures: Any = set()
+        for chunk in itertools.chain([first_chunk, second_chunk], chunks):
+            if len(futures) >= _MAX_WORKERS:
+                done, futures = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+            futures.add(executor.submit(_create_partitions_chunk, client_glue, batch_kwargs, chunk))
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
 
 
 @apply_configs
@@ -99,17 +261,99 @@ def add_csv_partitions(
     ... )
 
     """
-    inputs: List[Dict[str, Any]] = [
-        _csv_partition_definition(
-            location=k,
-            values=v,
-            bucketing_info=bucketing_info,
-            compression=compression,
-            sep=sep,
-            columns_types=columns_types,
+    add_partitions(
+        database=database,
+        table=table,
+        file_format="csv",
+        partitions_values=partitions_values,
+        bucketing_info=bucketing_info,
+        catalog_id=catalog_id,
+        compression=compression,
+        sep=sep,
+        boto3_session=boto3_session,
+        columns_types=columns_types,
+    )
+
+
+@apply_configs
+def add_partitions(
+    database: str,
+    table: str,
+    file_format: str,
+    partitions_values: Dict[str, List[str]],
+    bucketing_info: Optional[Tuple[List[str], int]] = None,
+    catalog_id: Optional[str] = None,
+    compression: Optional[str] = None,
+    sep: str = ",",
+    boto3_session: Optional[boto3.Session] = None,
+    columns_types: Optional[Dict[str, str]] = None,
+) -> None:
+    """Add partitions (metadata) to a Table in the AWS Glue Catalog.
+
+    Parameters
+    ----------
+    database : str
+        Database name.
+    table : str
+        Table name.
+    file_format : str
+        File format of the table: "parquet" | "csv".
+    partitions_values: Dict[str, List[str]]
+        Dictionary with keys as S3 path locations and values as a list of partitions values as str
+        (e.g. {'s3://bucket/prefix/y=2020/m=10/': ['2020', '10']}).
+    bucketing_info: Tuple[List[str], int], optional
+        Tuple consisting of the column names used for bucketing as the first element and the number of buckets as the
+        second element.
+        Only `str`, `int` and `bool` are supported as column data types for bucketing.
+    catalog_id : str, optional
+        The ID of the Data Catalog from which to retrieve Databases.
+        If none is provided, the AWS account ID is used by default.
+    compression: str, optional
+        Compression style (``None``, ``snappy``, ``gzip``, etc).
+    sep : str
+        String of length 1. Field delimiter for the output file. Only used for CSV tables.
+    boto3_session : boto3.Session(), optional
+        Boto3 Session. The default boto3 session will be used if boto3_session receive None.
+    columns_types: Optional[Dict[str, str]]
+        Only required for Hive compability.
+        Dictionary with keys as column names and values as data types (e.g. {'col0': 'bigint', 'col1': 'double'}).
+        P.S. Only materialized columns please, not partition columns.
+
+    Returns
+    -------
+    None
+        None.
+
+    Examples
+    --------
+    >>> import awswrangler as wr
+    >>> wr.catalog.add_partitions(
+    ...     database='default',
+    ...     table='my_table',
+    ...     file_format='parquet',
+    ...     partitions_values={
+    ...         's3://bucket/prefix/y=2020/m=10/': ['2020', '10'],
+    ...         's3://bucket/prefix/y=2020/m=11/': ['2020', '11'],
+    ...         's3://bucket/prefix/y=2020/m=12/': ['2020', '12']
+    ...     }
+    ... )
+
+    """
+    if file_format == "csv":
+        template: Dict[str, Any] = _csv_partition_template(
+            bucketing_info=bucketing_info, compression=compression, sep=sep, columns_types=columns_types
+        )
+    elif file_format == "parquet":
+        template = _parquet_partition_template(
+            bucketing_info=bucketing_info, compression=compression, columns_types=columns_types
         )
-        for k, v in partitions_values.items()
-    ]
+    else:
+        raise exceptions.InvalidArgumentValue("file_format argument must be parquet or csv")
+    if not partitions_values:
+        return
+    inputs: Iterator[Dict[str, Any]] = (
+        _fill_partition_template(template=template, location=k, values=v) for k, v in partitions_values.items()
+    )
     _add_partitions(database=database, table=table, boto3_session=boto3_session, inputs=inputs, catalog_id=catalog_id)
 
 
@@ -170,21 +414,17 @@ def add_parquet_partitions(
     ... )
 
     """
-    table = sanitize_table_name(table=table)
-    if partitions_values:
-        inputs: List[Dict[str, Any]] = [
-            _parquet_partition_definition(
-                location=k,
-                values=v,
-                bucketing_info=bucketing_info,
-                compression=compression,
-                columns_types=columns_types,
-            )
-            for k, v in partitions_values.items()
-        ]
-        _add_partitions(
-            database=database, table=table, boto3_session=boto3_session, inputs=inputs, catalog_id=catalog_id
-        )
+    add_partitions(
+        database=database,
+        table=sanitize_table_name(table=table),
+        file_format="parquet",
+        partitions_values=partitions_values,
+        bucketing_info=bucketing_info,
+        catalog_id=catalog_id,
+        compression=compression,
+        boto3_session=boto3_session,
+        columns_types=columns_types,
+    )
 
 
 @apply_configs
@@ -199,6 +439,12 @@ def add_column(
 ) -> None:
     """Add a column in a AWS Glue Catalog table.
 
+    Note
+    ----
+    If the column already exists with the same type the call returns without
+    issuing an update, keeping the function idempotent and saving one
+    round-trip. A different type raises InvalidArgumentValue.
+
     Parameters
     ----------
     database : str
@@ -232,18 +478,96 @@ def add_column(
     ...     column_type='int'
     ... )
     """
-    if _check_column_type(column_type):
-        client_glue: boto3.client = _utils.client(service_name="glue", session=boto3_session)
-        table_res: Dict[str, Any] = client_glue.get_table(DatabaseName=database, Name=table)
-        table_input: Dict[str, Any] = _update_table_definition(table_res)
-        table_input["StorageDescriptor"]["Columns"].append(
-            {"Name": column_name, "Type": column_type, "Comment": column_comment}
-        )
-        res: Dict[str, Any] = client_glue.update_table(
-            **_catalog_id(catalog_id=catalog_id, DatabaseName=database, TableInput=table_input)
-        )
-        if ("Errors" in res) and res["Errors"]:
-            for error in res["Errors"]:
-                if "ErrorDetail" in error:
-                    if "ErrorCode" in error["ErrorDetail"]:
-                        raise exceptions.ServiceApiError(str(res["Errors"]))
+    add_columns(
+        database=database,
+        table=table,
+        columns_types={column_name: column_type},
+        columns_comments=None if column_comment is None else {column_name: column_comment},
+        boto3_session=boto3_session,
+        catalog_id=catalog_id,
+    )
+
+
+@apply_configs
+def add_columns(
+    database: str,
+    table: str,
+    columns_types: Dict[str, str],
+    columns_comments: Optional[Dict[str, str]] = None,
+    boto3_session: Optional[boto3.Session] = None,
+    catalog_id: Optional[str] = None,
+) -> None:
+    """Add columns in a AWS Glue Catalog table with a single table update.
+
+    Note
+    ----
+    All columns are appended with one get_table plus one update_table call,
+    instead of one pair per column. Columns already present with the same type
+    are skipped, keeping the function idempotent and saving the update
+    round-trip when there is nothing new to add. A different type raises
+    InvalidArgumentValue.
+
+    Parameters
+    ----------
+    database : str
+        Database name.
+    table : str
+        Table name.
+    columns_types: Dict[str, str]
+        Dictionary with keys as column names and values as data types (e.g. {'col2': 'bigint', 'col3': 'double'}).
+    columns_comments: Dict[str, str], optional
+        Dictionary with keys as column names and values as comments.
+    boto3_session : boto3.Session(), optional
+        Boto3 Session. The default boto3 session will be used if boto3_session receive None.
+    catalog_id : str, optional
+        The ID of the Data Catalog from which to retrieve Databases.
+        If none is provided, the AWS account ID is used by default.
+
+    Returns
+    -------
+    None
+        None
+
+    Examples
+    --------
+    >>> import awswrangler as wr
+    >>> wr.catalog.add_columns(
+    ...     database='my_db',
+    ...     table='my_table',
+    ...     columns_types={'col2': 'int', 'col3': 'string'}
+    ... )
+    """
+    if not columns_types:
+        return
+    for column_type in columns_types.values():
+        _check_column_type(column_type)
+    comments: Dict[str, str] = columns_comments if columns_comments is not None else {}
+    client_glue: boto3.client = _glue_client(boto3_session=boto3_session)
+    table_res: Dict[str, Any] = client_glue.get_table(DatabaseName=database, Name=table)
+    table_input: Dict[str, Any] = _update_table_definition(table_res)
+    current_types: Dict[str, str] = {c["Name"]: c["Type"] for c in table_input["StorageDescriptor"]["Columns"]}
+    new_columns: List[Dict[str, Any]] = []
+    for column_name, column_type in columns_types.items():
+        current_type: Optional[str] = current_types.get(column_name)
+        if current_type is None:
+            new_column: Dict[str, str] = {"Name": column_name, "Type": column_type}
+            comment: Optional[str] = comments.get(column_name)
+            if comment is not None:
+                new_column["Comment"] = comment
+            new_columns.append(new_column)
+        elif current_type != column_type:
+            raise exceptions.InvalidArgumentValue(
+                f"Column {column_name} already exists on {database}.{table} "
+                f"with type {current_type} (requested: {column_type})."
+            )
+        else:
+            _logger.debug("Column %s already exists on %s.%s. Skipping update.", column_name, database, table)
+    if not new_columns:
+        return
+    table_input["StorageDescriptor"]["Columns"].extend(new_columns)
+    res: Dict[str, Any] = client_glue.update_table(
+        **_catalog_id(catalog_id=catalog_id, DatabaseName=database, TableInput=table_input)
+    )
+    errors: Optional[List[Dict[str, Any]]] = res.get("Errors")
+    if errors and any("ErrorCode" in error.get("ErrorDetail", {}) for error in errors):
+        raise exceptions.ServiceApiError(str(errors))
@@ -1,5 +1,6 @@
 """AWS Glue Catalog Delete Module."""
 
+import functools
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -65,19 +66,16 @@ def _parquet_table_definition(
     }
 
 
-def _parquet_partition_definition(
-    location: str,
-    values: List[str],
+def _parquet_partition_template(
     bucketing_info: Optional[Tuple[List[str], int]],
     compression: Optional[str],
     columns_types: Optional[Dict[str, str]],
 ) -> Dict[str, Any]:
     compressed: bool = compression is not None
-    definition: Dict[str, Any] = {
+    template: Dict[str, Any] = {
         "StorageDescriptor": {
             "InputFormat": "org.apache.hadoop.hive.ql.io.parquet.MapredParquetInputFormat",
             "OutputFormat": "org.apache.hadoop.hive.ql.io.parquet.MapredParquetOutputFormat",
-            "Location": location,
             "Compressed": compressed,
             "SerdeInfo": {
                 "Parameters": {"serialization.format": "1"},
@@ -87,12 +85,20 @@ def _parquet_partition_definition(
             "NumberOfBuckets": -1 if bucketing_info is None else bucketing_info[1],
             "BucketColumns": [] if bucketing_info is None else bucketing_info[0],
         },
-        "Values": values,
     }
     if columns_types is not None:
-        definition["StorageDescriptor"]["Columns"] = [
+        template["StorageDescriptor"]["Columns"] = [
             {"Name": cname, "Type": dtype} for cname, dtype in columns_types.items()
         ]
+    return template
+
+
+def _fill_partition_template(template: Dict[str, Any], location: str, values: List[str]) -> Dict[str, Any]:
+    definition: Dict[str, Any] = dict(template)
+    storage_descriptor: Dict[str, Any] = dict(template["StorageDescriptor"])
+    storage_descriptor["Location"] = location
+    definition["StorageDescriptor"] = storage_descriptor
+    definition["Values"] = values
     return definition
 
 
@@ -148,20 +154,17 @@ def _csv_table_definition(
     }
 
 
-def _csv_partition_definition(
-    location: str,
-    values: List[str],
+def _csv_partition_template(
     bucketing_info: Optional[Tuple[List[str], int]],
     compression: Optional[str],
     sep: str,
     columns_types: Optional[Dict[str, str]],
 ) -> Dict[str, Any]:
     compressed: bool = compression is not None
-    definition: Dict[str, Any] = {
+    template: Dict[str, Any] = {
         "StorageDescriptor": {
             "InputFormat": "org.apache.hadoop.mapred.TextInputFormat",
             "OutputFormat": "org.apache.hadoop.hive.ql.io.HiveIgnoreKeyTextOutputFormat",
-            "Location": location,
             "Compressed": compressed,
             "SerdeInfo": {
                 "Parameters": {"field.delim": sep, "escape.delim": "\\"},
@@ -171,15 +174,15 @@ def _csv_partition_definition(
             "NumberOfBuckets": -1 if bucketing_info is None else bucketing_info[1],
             "BucketColumns": [] if bucketing_info is None else bucketing_info[0],
         },
-        "Values": values,
     }
     if columns_types is not None:
-        definition["StorageDescriptor"]["Columns"] = [
+        template["StorageDescriptor"]["Columns"] = [
             {"Name": cname, "Type": dtype} for cname, dtype in columns_types.items()
         ]
-    return definition
+    return template
 
 
+@functools.lru_cache(maxsize=256)
 def _check_column_type(column_type: str) -> bool:
     if column_type not in _LEGAL_COLUMN_TYPES:
         raise ValueError(f"{column_type} is not a legal data type.")
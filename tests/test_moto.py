@@ -501,6 +501,46 @@ def test_glue_get_partition(moto_glue):
     assert parquet_partition_value == values
 
 
+def test_glue_add_partitions_file_format(moto_glue):
+    database_name = "mydb_add_partitions"
+    table_name = "mytable"
+    values = {"s3://bucket/prefix/dt=2020-01-01": ["2020-01-01"], "s3://bucket/prefix/dt=2020-01-02": ["2020-01-02"]}
+
+    wr.catalog.create_database(name=database_name)
+    wr.catalog.create_csv_table(
+        database=database_name,
+        table=table_name,
+        path="s3://bucket/prefix/",
+        columns_types={"col0": "bigint"},
+        partitions_types={"dt": "date"},
+    )
+    wr.catalog.add_partitions(database=database_name, table=table_name, file_format="csv", partitions_values=values)
+    assert wr.catalog.get_partitions(database_name, table_name) == values
+    with pytest.raises(wr.exceptions.InvalidArgumentValue):
+        wr.catalog.add_partitions(database=database_name, table=table_name, file_format="orc", partitions_values=values)
+
+
+def test_glue_add_columns(moto_glue):
+    database_name = "mydb_add_columns"
+    table_name = "mytable"
+
+    wr.catalog.create_database(name=database_name)
+    wr.catalog.create_parquet_table(
+        database=database_name,
+        table=table_name,
+        path="s3://bucket/prefix/",
+        columns_types={"col0": "bigint"},
+    )
+    wr.catalog.add_columns(database=database_name, table=table_name, columns_types={"col1": "double", "col2": "string"})
+    dtypes = wr.catalog.get_table_types(database=database_name, table=table_name)
+    assert dtypes == {"col0": "bigint", "col1": "double", "col2": "string"}
+    wr.catalog.add_column(database=database_name, table=table_name, column_name="col1", column_type="double")
+    dtypes = wr.catalog.get_table_types(database=database_name, table=table_name)
+    assert len(dtypes) == 3
+    with pytest.raises(wr.exceptions.InvalidArgumentValue):
+        wr.catalog.add_column(database=database_name, table=table_name, column_name="col1", column_type="string")
+
+
 def test_dynamodb_basic_usage(moto_dynamodb):
     table_name = "table"
     items = [{"key": 1}, {"key": 2, "my_value": "Hello"}]